@@ -5,6 +5,8 @@ Enhanced search with date range and multiple filter criteria
 
 import streamlit as st
 from typing import List, Dict, Any, Optional
+
+from components.post_editor import _display_image_with_fallback
 from datetime import datetime, timedelta
 
 
@@ -114,23 +116,27 @@ def apply_advanced_filters(
     Returns:
         Filtered posts list
     """
-    filtered = posts
-
-    # Search filter
-    if search_query and search_query.strip():
-        query = search_query.lower().strip()
-        filtered = [
-            p for p in filtered
-            if query in p.get("fields", {}).get("Title", "").lower()
-            or query in p.get("fields", {}).get("Post Content", "").lower()
-        ]
-
-    # Status filter
-    if status_filters:
-        filtered = [
-            p for p in filtered
-            if p.get("fields", {}).get("Status") in status_filters
-        ]
+    query = search_query.lower().strip() if search_query and search_query.strip() else None
+
+    # Single pass for the search and status predicates: "fields" is
+    # unpacked once per post instead of up to three times
+    if query is not None or status_filters:
+        filtered = []
+        for post in posts:
+            fields = post.get("fields") or {}
+
+            if status_filters and fields.get("Status") not in status_filters:
+                continue
+
+            if query is not None and (
+                query not in fields.get("Title", "").lower()
+                and query not in fields.get("Post Content", "").lower()
+            ):
+                continue
+
+            filtered.append(post)
+    else:
+        filtered = posts
 
     # Date range filter
     if date_range != "All Time":
@@ -229,7 +235,9 @@ def display_search_results(filtered_posts: List[Dict[str, Any]]) -> None:
 
             with col2:
                 if fields.get("Image URL"):
-                    st.image(fields.get("Image URL"), width=150)
+                    # Cached-bytes helper: one download per URL per
+                    # hour, not one per rerun
+                    _display_image_with_fallback(fields.get("Image URL"), width=150)
 
             # Additional metadata
             st.caption(f"**Record ID:** {record_id}")
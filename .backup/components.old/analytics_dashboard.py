@@ -11,6 +11,15 @@ from datetime import datetime, timedelta
 from collections import Counter
 
 
+def compute_status_counts(posts: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Count posts per status in a single pass over the list"""
+    status_counts: Dict[str, int] = {}
+    for post in posts:
+        status = post.get("fields", {}).get("Status", "Unknown")
+        status_counts[status] = status_counts.get(status, 0) + 1
+    return status_counts
+
+
 def render_analytics_dashboard(posts: List[Dict[str, Any]]) -> None:
     """
     Render comprehensive analytics dashboard
@@ -24,19 +33,22 @@ def render_analytics_dashboard(posts: List[Dict[str, Any]]) -> None:
 
     st.subheader("📊 Analytics Dashboard")
 
+    # Count statuses once and share across all sections below
+    status_counts = compute_status_counts(posts)
+
     # Key metrics
     st.write("### Key Metrics")
-    display_key_metrics(posts)
+    display_key_metrics(posts, status_counts)
 
     # Status distribution
     st.write("### Posts by Status")
     col1, col2 = st.columns(2)
 
     with col1:
-        display_status_pie_chart(posts)
+        display_status_pie_chart(status_counts)
 
     with col2:
-        display_status_bar_chart(posts)
+        display_status_bar_chart(status_counts)
 
     # Timeline metrics
     st.write("### Publishing Timeline")
@@ -44,20 +56,15 @@ def render_analytics_dashboard(posts: List[Dict[str, Any]]) -> None:
 
     # Approval metrics
     st.write("### Approval Rate")
-    display_approval_metrics(posts)
+    display_approval_metrics(posts, status_counts)
 
     # Topic analysis
     st.write("### Content Themes")
     display_topic_analysis(posts)
 
 
-def display_key_metrics(posts: List[Dict[str, Any]]) -> None:
+def display_key_metrics(posts: List[Dict[str, Any]], status_counts: Dict[str, int]) -> None:
     """Display key performance metrics"""
-    status_counts = {}
-    for post in posts:
-        status = post.get("fields", {}).get("Status", "Unknown")
-        status_counts[status] = status_counts.get(status, 0) + 1
-
     col1, col2, col3, col4, col5 = st.columns(5)
 
     with col1:
@@ -101,13 +108,8 @@ def display_key_metrics(posts: List[Dict[str, Any]]) -> None:
         )
 
 
-def display_status_pie_chart(posts: List[Dict[str, Any]]) -> None:
+def display_status_pie_chart(status_counts: Dict[str, int]) -> None:
     """Display pie chart of post statuses"""
-    status_counts = {}
-    for post in posts:
-        status = post.get("fields", {}).get("Status", "Unknown")
-        status_counts[status] = status_counts.get(status, 0) + 1
-
     fig = go.Figure(
         data=[
             go.Pie(
@@ -127,13 +129,8 @@ def display_status_pie_chart(posts: List[Dict[str, Any]]) -> None:
     st.plotly_chart(fig, use_container_width=True)
 
 
-def display_status_bar_chart(posts: List[Dict[str, Any]]) -> None:
+def display_status_bar_chart(status_counts: Dict[str, int]) -> None:
     """Display bar chart of post statuses"""
-    status_counts = {}
-    for post in posts:
-        status = post.get("fields", {}).get("Status", "Unknown")
-        status_counts[status] = status_counts.get(status, 0) + 1
-
     statuses = list(status_counts.keys())
     counts = list(status_counts.values())
 
@@ -192,16 +189,10 @@ def display_publishing_timeline(posts: List[Dict[str, Any]]) -> None:
         st.info("No date data available for timeline")
 
 
-def display_approval_metrics(posts: List[Dict[str, Any]]) -> None:
+def display_approval_metrics(posts: List[Dict[str, Any]], status_counts: Dict[str, int]) -> None:
     """Display approval rate and workflow metrics"""
     col1, col2, col3 = st.columns(3)
 
-    # Calculate workflow metrics
-    status_counts = {}
-    for post in posts:
-        status = post.get("fields", {}).get("Status", "Unknown")
-        status_counts[status] = status_counts.get(status, 0) + 1
-
     total_posts = len(posts)
     approved_posts = status_counts.get("Approved - Ready to Schedule", 0)
     scheduled_posts = status_counts.get("Scheduled", 0)
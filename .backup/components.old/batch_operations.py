@@ -6,11 +6,20 @@ Handles bulk selection and operations on multiple posts
 import streamlit as st
 from typing import List, Dict, Any, Callable
 
+# Shared cache module: clearing it here invalidates the same entries
+# the app reads from, which importing "app" (run as __main__) would not
+from components.data_cache import invalidate_post_caches
 
+
+@st.fragment
 def render_batch_operations_toolbar(posts: List[Dict[str, Any]], clients: Any) -> None:
     """
     Render batch operations toolbar with checkboxes and bulk action buttons
 
+    Runs as a fragment: toggling a checkbox or clicking select-all reruns
+    only this toolbar instead of the whole app. The st.rerun() calls after
+    bulk actions still trigger a full-app rerun so the table refreshes.
+
     Args:
         posts: List of post records from Airtable
         clients: Dictionary with airtable and modal clients
@@ -20,21 +29,26 @@ def render_batch_operations_toolbar(posts: List[Dict[str, Any]], clients: Any) -
 
     st.subheader("📦 Batch Operations")
 
+    # Snapshot the proxy once: every st.session_state attribute access
+    # below would otherwise go through the SessionStateProxy layer per row
+    ss = st.session_state
+
     # Initialize batch selection state
-    if "batch_selected_posts" not in st.session_state:
-        st.session_state.batch_selected_posts = set()
+    if "batch_selected_posts" not in ss:
+        ss.batch_selected_posts = set()
+    selected_ids = ss.batch_selected_posts
 
     # Select All / Deselect All buttons
     col1, col2, col3 = st.columns([1, 1, 3])
 
     with col1:
         if st.button("☑️ Select All", use_container_width=True):
-            st.session_state.batch_selected_posts = set(p.get("id") for p in posts)
+            ss.batch_selected_posts = set(p.get("id") for p in posts)
             st.rerun()
 
     with col2:
         if st.button("☐ Clear All", use_container_width=True):
-            st.session_state.batch_selected_posts = set()
+            ss.batch_selected_posts = set()
             st.rerun()
 
     with col3:
@@ -48,51 +62,46 @@ def render_batch_operations_toolbar(posts: List[Dict[str, Any]], clients: Any) -
         fields = post.get("fields", {})
         title = fields.get("Title", "Untitled")[:40]
         status = fields.get("Status", "Unknown")
+        # Widget key built once per row via plain concat (no f-string parse)
+        checkbox_key = "batch_checkbox_" + record_id
 
         col1, col2 = st.columns([0.5, 5])
 
         with col1:
             is_selected = st.checkbox(
                 label="",
-                value=record_id in st.session_state.batch_selected_posts,
-                key=f"batch_checkbox_{record_id}",
+                value=record_id in selected_ids,
+                key=checkbox_key,
             )
 
             if is_selected:
-                st.session_state.batch_selected_posts.add(record_id)
+                selected_ids.add(record_id)
             else:
-                st.session_state.batch_selected_posts.discard(record_id)
+                selected_ids.discard(record_id)
 
         with col2:
             st.write(f"📄 **{title}** • {status}")
 
     # Batch action buttons
-    if st.session_state.batch_selected_posts:
-        selected_count = len(st.session_state.batch_selected_posts)
-        st.info(f"✅ {selected_count} post(s) selected")
+    if selected_ids:
+        st.info(f"✅ {len(selected_ids)} post(s) selected")
 
         st.write("#### Bulk Actions:")
         col1, col2, col3 = st.columns(3)
 
         with col1:
             if st.button("✅ Approve All Selected", use_container_width=True):
-                handle_bulk_approve(
-                    list(st.session_state.batch_selected_posts), clients
-                )
+                handle_bulk_approve(list(selected_ids), clients)
 
         with col2:
             if st.button("❌ Reject All Selected", use_container_width=True):
-                handle_bulk_reject(
-                    list(st.session_state.batch_selected_posts), clients
-                )
+                handle_bulk_reject(list(selected_ids), clients)
 
         with col3:
             if st.button("🗑️ Delete All Selected", use_container_width=True):
                 st.warning("⚠️ This action cannot be undone")
                 if st.button("Confirm Delete"):
-                    handle_bulk_delete(
-                        list(st.session_state.batch_selected_posts), clients
-                    )
+                    handle_bulk_delete(list(selected_ids), clients)
 
 
 def handle_bulk_approve(record_ids: List[str], clients: Any) -> None:
@@ -105,25 +114,19 @@ def handle_bulk_approve(record_ids: List[str], clients: Any) -> None:
     """
     airtable_client = clients["airtable"]
 
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-
-    for idx, record_id in enumerate(record_ids):
+    with st.spinner(f"⏳ Approving {len(record_ids)} post(s)..."):
         try:
-            status_text.text(f"⏳ Approving {idx + 1} of {len(record_ids)}...")
-
-            # Update Airtable status - Modal's scheduler will pick these up
-            airtable_client.update_status(record_id, "Approved - Ready to Schedule")
-
-            progress_bar.progress((idx + 1) / len(record_ids))
-
+            # Single .in_() update - Modal's scheduler will pick these up
+            airtable_client.update_status_bulk(record_ids, "Approved - Ready to Schedule")
         except Exception as e:
-            st.error(f"❌ Error approving post {record_id}: {str(e)}")
+            st.error(f"❌ Error approving posts: {str(e)}")
+            return
 
     st.success(
         f"✅ Successfully approved {len(record_ids)} post(s)! They will be scheduled by the system."
     )
     st.session_state.batch_selected_posts = set()
+    invalidate_post_caches()
     st.rerun()
 
 
@@ -137,25 +140,19 @@ def handle_bulk_reject(record_ids: List[str], clients: Any) -> None:
     """
     airtable_client = clients["airtable"]
 
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-
-    for idx, record_id in enumerate(record_ids):
+    with st.spinner(f"⏳ Rejecting {len(record_ids)} post(s)..."):
         try:
-            status_text.text(f"⏳ Rejecting {idx + 1} of {len(record_ids)}...")
-
-            # Update Airtable status - Modal's cleanup will pick these up
-            airtable_client.update_status(record_id, "Rejected")
-
-            progress_bar.progress((idx + 1) / len(record_ids))
-
+            # Single .in_() update - Modal's cleanup will pick these up
+            airtable_client.update_status_bulk(record_ids, "Rejected")
         except Exception as e:
-            st.error(f"❌ Error rejecting post {record_id}: {str(e)}")
+            st.error(f"❌ Error rejecting posts: {str(e)}")
+            return
 
     st.success(
         f"✅ Successfully rejected {len(record_ids)} post(s)! They will be deleted in 7 days."
     )
     st.session_state.batch_selected_posts = set()
+    invalidate_post_caches()
     st.rerun()
 
 
@@ -169,21 +166,12 @@ def handle_bulk_delete(record_ids: List[str], clients: Any) -> None:
     """
     airtable_client = clients["airtable"]
 
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-
-    for idx, record_id in enumerate(record_ids):
-        try:
-            status_text.text(f"⏳ Deleting {idx + 1} of {len(record_ids)}...")
-
-            # Delete from Airtable
-            airtable_client.delete_post(record_id)
-
-            progress_bar.progress((idx + 1) / len(record_ids))
-
-        except Exception as e:
-            st.error(f"❌ Error deleting post {record_id}: {str(e)}")
+    with st.spinner(f"⏳ Deleting {len(record_ids)} post(s)..."):
+        if not airtable_client.delete_posts_bulk(record_ids):
+            st.error("❌ Error deleting posts")
+            return
 
     st.success(f"✅ Successfully deleted {len(record_ids)} post(s)!")
     st.session_state.batch_selected_posts = set()
+    invalidate_post_caches()
     st.rerun()
@@ -5,9 +5,23 @@ Shows scheduled posts on a monthly calendar
 
 import streamlit as st
 import calendar
+import sys
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 
+from components.post_editor import _display_image_with_fallback
+
+# datetime.fromisoformat parses a trailing "Z" natively on Python 3.11+;
+# only older versions need the replace() allocation per parse
+if sys.version_info >= (3, 11):
+    def _parse_iso(date_str: str) -> datetime:
+        return datetime.fromisoformat(date_str)
+else:
+    def _parse_iso(date_str: str) -> datetime:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+
+_FMT_SCHEDULED = "%a, %b %d at %I:%M %p"
+
 
 def render_calendar_view(posts: List[Dict[str, Any]]) -> None:
     """
@@ -78,6 +92,8 @@ def get_scheduled_posts_for_month(
     Returns:
         Posts scheduled for that month
     """
+    # Decorate with the parsed timestamp so each post is parsed exactly once
+    # (instead of re-parsing in the sort key)
     scheduled = []
 
     for post in posts:
@@ -94,20 +110,16 @@ def get_scheduled_posts_for_month(
 
         try:
             # Parse ISO format timestamp
-            scheduled_time = datetime.fromisoformat(scheduled_time_str.replace("Z", "+00:00"))
+            scheduled_time = _parse_iso(scheduled_time_str)
 
             # Check if it's in the requested month/year
             if scheduled_time.month == month and scheduled_time.year == year:
-                scheduled.append(post)
+                scheduled.append((scheduled_time, post))
         except (ValueError, TypeError):
             continue
 
-    return sorted(
-        scheduled,
-        key=lambda p: datetime.fromisoformat(
-            p.get("fields", {}).get("Scheduled Time", "").replace("Z", "+00:00")
-        )
-    )
+    scheduled.sort(key=lambda pair: pair[0])
+    return [post for _, post in scheduled]
 
 
 def render_calendar_grid(
@@ -133,7 +145,7 @@ def render_calendar_grid(
         scheduled_time_str = fields.get("Scheduled Time", "")
 
         try:
-            dt = datetime.fromisoformat(scheduled_time_str.replace("Z", "+00:00"))
+            dt = _parse_iso(scheduled_time_str)
             day = dt.day
             if day not in posts_by_date:
                 posts_by_date[day] = []
@@ -178,8 +190,8 @@ def display_scheduled_post(post: Dict[str, Any]) -> None:
     scheduled_time_str = fields.get("Scheduled Time", "")
 
     try:
-        dt = datetime.fromisoformat(scheduled_time_str.replace("Z", "+00:00"))
-        time_str = dt.strftime("%a, %b %d at %I:%M %p")
+        dt = _parse_iso(scheduled_time_str)
+        time_str = dt.strftime(_FMT_SCHEDULED)
     except (ValueError, TypeError):
         time_str = "Time pending"
 
@@ -193,9 +205,13 @@ def display_scheduled_post(post: Dict[str, Any]) -> None:
 
         with col2:
             if fields.get("Image URL"):
-                st.image(fields.get("Image URL"), width=150)
+                # Cached-bytes helper: one download per URL per hour,
+                # not one per rerun
+                _display_image_with_fallback(fields.get("Image URL"), width=150)
 
-        # Additional info
-        st.caption(f"Status: {fields.get('Status', 'Unknown')}")
+        # Additional info - one caption call so the expander footer is a
+        # single delta over the websocket instead of one per line
+        info = f"Status: {fields.get('Status', 'Unknown')}"
         if fields.get("LinkedIn Post URL"):
-            st.caption(f"[View on LinkedIn]({fields.get('LinkedIn Post URL')})")
+            info += f"  \n[View on LinkedIn]({fields.get('LinkedIn Post URL')})"
+        st.caption(info)
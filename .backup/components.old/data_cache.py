@@ -0,0 +1,50 @@
+"""
+Shared Post-List Cache
+Holds the st.cache_data layer over the post list in a module both the
+app and the components import. Streamlit runs the entrypoint as
+__main__, so a component importing "app" would get a second module
+object with its own (empty) cache entries — clearing those would never
+invalidate the cache the app is actually serving from.
+"""
+
+import streamlit as st
+
+
+@st.cache_data(ttl=30)
+def load_posts(_client):
+    """Fetch all posts, cached for 30 seconds across reruns and sessions
+
+    The client's own in-memory TTL cache covers repeat calls on one
+    instance; this layer additionally skips the field-name conversion
+    work on reruns and is invalidated by the same 30-second window. The
+    client is underscore-prefixed so Streamlit does not try to hash it.
+    """
+    return _client.get_all_posts()
+
+
+@st.cache_data(ttl=30)
+def aggregate_status_counts(posts_fingerprint, _posts):
+    """Count posts per status, cached for 30 seconds
+
+    The post list itself is expensive to hash, so it is passed as an
+    underscore-prefixed (unhashed) argument and the cache is keyed on the
+    cheap record-id fingerprint instead.
+    """
+    stats = {}
+    for post in _posts:
+        status = post.get("fields", {}).get("Status", "Unknown")
+        stats[status] = stats.get(status, 0) + 1
+    return stats
+
+
+def invalidate_post_caches():
+    """Drop the cached post list and stats after a write
+
+    The client's own _clear_cache() runs inside update_status, but this
+    outer st.cache_data layer sits above the client and would keep
+    serving the stale list for up to 30 s. The stats cache is keyed on
+    an id-only fingerprint that does not change on a status flip, so it
+    must be cleared explicitly too.
+    """
+    load_posts.clear()
+    aggregate_status_counts.clear()
@@ -6,21 +6,17 @@ Allows editing post content and generating images with direct Replicate API
 import streamlit as st
 from typing import Dict, Any
 from utils.direct_processors import generate_image_from_post
-import requests
-from io import BytesIO
 
 
-def _download_and_cache_image(image_url: str, cache_key: str) -> bytes:
-    """Download and cache image in session state"""
-    try:
-        if cache_key not in st.session_state:
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            st.session_state[cache_key] = response.content
-        return st.session_state[cache_key]
-    except Exception as e:
-        st.warning(f"Could not cache image: {str(e)[:50]}")
-        return None
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _fetch_image(image_url: str) -> bytes:
+    """Download image bytes, cached by URL across reruns and sessions"""
+    # Lazy import: sessions that never render an image skip the module
+    import requests
+
+    response = requests.get(image_url, timeout=10)
+    response.raise_for_status()
+    return response.content
 
 
 def _display_image_with_fallback(image_url: str, caption: str = "", width: int = 400):
@@ -30,8 +26,7 @@ def _display_image_with_fallback(image_url: str, caption: str = "", width: int =
 
     # Try method 1: Download and display from cache
     try:
-        cache_key = f"image_cache_{image_url.split('/')[-1]}"
-        image_data = _download_and_cache_image(image_url, cache_key)
+        image_data = _fetch_image(image_url)
         if image_data:
             st.image(image_data, caption=caption, width=width, use_container_width=False)
             return
@@ -61,7 +56,9 @@ def render_post_editor(post: Dict[str, Any], clients) -> bool:
     Returns:
         True if changes were saved, False otherwise
     """
-    fields = post.get("fields", {})
+    # Unpack once; fg keeps the later lookups to a bound-method call
+    fields = post.get("fields") or {}
+    fg = fields.get
     record_id = post.get("id", "")
 
     st.subheader("✏️ Edit Post")
@@ -76,14 +73,14 @@ def render_post_editor(post: Dict[str, Any], clients) -> bool:
             # Title field
             title = st.text_input(
                 "Post Title:",
-                value=fields.get("Title", ""),
+                value=fg("Title", ""),
                 help="The main heading for your post"
             )
 
             # Content field
             content = st.text_area(
                 "Post Content:",
-                value=fields.get("Post Content", ""),
+                value=fg("Post Content", ""),
                 height=250,
                 help="Main body text for your post"
             )
@@ -117,7 +114,7 @@ def render_post_editor(post: Dict[str, Any], clients) -> bool:
 
     # IMAGE TAB
     with image_tab:
-        current_image_url = fields.get("Image URL", "")
+        current_image_url = fg("Image URL", "")
 
         # Display current image
         st.write("**Current Image:**")
@@ -131,17 +128,20 @@ def render_post_editor(post: Dict[str, Any], clients) -> bool:
         # Image generation section
         st.write("**Generate New Image:**")
 
-        col1, col2 = st.columns([2, 1])
+        # Form batches the prompt input: typing no longer triggers a full
+        # rerun per keystroke, only the submit does
+        with st.form(key=f"image_form_{record_id}"):
+            col1, col2 = st.columns([2, 1])
 
-        with col1:
-            custom_prompt = st.text_input(
-                "Custom Image Prompt (optional)",
-                placeholder="Leave empty to use post content as prompt",
-                help="Describe what image you want to generate"
-            )
+            with col1:
+                custom_prompt = st.text_input(
+                    "Custom Image Prompt (optional)",
+                    placeholder="Leave empty to use post content as prompt",
+                    help="Describe what image you want to generate"
+                )
 
-        with col2:
-            generate_button = st.button("🖼️ Generate Image", use_container_width=True, key=f"gen_btn_{record_id}")
+            with col2:
+                generate_button = st.form_submit_button("🖼️ Generate Image", use_container_width=True)
 
         # Handle image generation
         if generate_button:
@@ -151,10 +151,10 @@ def render_post_editor(post: Dict[str, Any], clients) -> bool:
                 with st.spinner("⏳ Generating image... (30-60 seconds)"):
                     # If custom prompt provided, we need to handle it differently
                     if custom_prompt:
-                        # For custom prompts, we'll call the Claude client to create a prompt
-                        from utils.direct_processors import ReplicateClient
+                        # Custom prompt goes straight to the shared Replicate client
+                        from utils.direct_processors import get_replicate_client
 
-                        replicate = ReplicateClient()
+                        replicate = get_replicate_client()
                         image_url = replicate.generate_image(custom_prompt)
 
                         if image_url:
@@ -4,19 +4,70 @@ Displays posts in an interactive table with filtering and quick actions
 """
 
 import streamlit as st
-import pandas as pd
+import sys
+from functools import lru_cache
 from typing import List, Dict, Optional, Callable
 from datetime import datetime
 
+from config import POST_STATUSES
+
+# Selectbox options are fixed for the process lifetime; build the tuple
+# once at import instead of re-listing the statuses on every rerun
+_STATUS_OPTIONS = ("All", *POST_STATUSES.keys())
+
+# datetime.fromisoformat parses a trailing "Z" natively on Python 3.11+;
+# older versions pay for the suffix rewrite only when a "Z" is present
+if sys.version_info >= (3, 11):
+    _iso_to_dt = datetime.fromisoformat
+else:
+    def _iso_to_dt(date_str: str) -> datetime:
+        if date_str.endswith("Z"):
+            date_str = date_str[:-1] + "+00:00"
+        return datetime.fromisoformat(date_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(date_str: str) -> datetime:
+    """Parse an ISO timestamp string, memoized per raw string
+
+    Streamlit reruns the whole script on every interaction, so the same
+    handful of timestamp strings get re-parsed constantly. The cache is
+    keyed on the small raw string, making repeat parses a dict lookup.
+    """
+    return _iso_to_dt(date_str)
+
+
+_FMT = "%b %d, %Y %I:%M %p"
+
+
+@lru_cache(maxsize=4096)
+def _format_iso(date_str: str) -> str:
+    """Parse + strftime an ISO timestamp, memoized per raw string
+
+    strftime is pure-Python and shows up on every rerun, so caching the
+    finished display string (not just the datetime) means repeat renders
+    of the same timestamp cost a single dict lookup.
+    """
+    return _parse_iso(date_str).strftime(_FMT)
+
+
+def _looks_iso(date_str: str) -> bool:
+    """Cheap shape check so obvious non-dates skip exception setup
+
+    Length 10 admits date-only strings like "2026-08-29", which
+    fromisoformat parses (midnight) and which were formatted before this
+    gate existed; the dash probes still reject free text quickly.
+    """
+    return len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-"
+
 
 def format_date(date_str: Optional[str]) -> str:
     """Format ISO datetime string to readable format"""
-    if not date_str:
-        return "—"
+    if not date_str or not _looks_iso(date_str):
+        return date_str or "—"
     try:
-        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        return dt.strftime("%b %d, %Y %I:%M %p")
-    except:
+        return _format_iso(date_str)
+    except ValueError:
         return date_str
 
 
@@ -42,6 +93,11 @@ def render_post_table(
     Returns:
         Selected post ID if row clicked, None otherwise
     """
+    # pandas is only needed for the table view; importing lazily keeps
+    # it off the cold-start path (sys.modules makes repeat calls a dict
+    # lookup)
+    import pandas as pd
+
     if not posts:
         st.info("No posts found")
         return None
@@ -57,59 +113,74 @@ def render_post_table(
         st.info(f"No posts with status: {status_filter}")
         return None
 
-    # Prepare data for display
-    table_data = []
-    for post in posts:
-        fields = post.get("fields", {})
-        table_data.append({
-            "ID": post.get("id", ""),
-            "Title": fields.get("Title", "Untitled")[:50],  # Truncate for display
-            "Status": fields.get("Status", "Unknown"),
-            "Created": format_date(fields.get("Created")),
-            "Scheduled": format_date(fields.get("Scheduled Time")),
-            "Posted": format_date(fields.get("Posted")),
-        })
-
-    df = pd.DataFrame(table_data)
-
-    # Display table
-    st.dataframe(
+    # Prepare data for display: one tuple per row into from_records,
+    # which skips the per-row dict allocation and column inference that
+    # DataFrame(list-of-dicts) pays for. Dates stay raw here and are
+    # formatted column-wise below in pandas C code rather than 3N
+    # Python-level format_date calls.
+    rows = [
+        (
+            post.get("id", ""),
+            (fields := post.get("fields", {})).get("Title", "Untitled")[:50],
+            fields.get("Status", "Unknown"),
+            fields.get("Created"),
+            fields.get("Scheduled Time"),
+            fields.get("Posted"),
+        )
+        for post in posts
+    ]
+    df = pd.DataFrame.from_records(
+        rows, columns=["ID", "Title", "Status", "Created", "Scheduled", "Posted"]
+    )
+
+    for col in ("Created", "Scheduled", "Posted"):
+        parsed = pd.to_datetime(df[col], format="ISO8601", errors="coerce", utc=True)
+        # Keep format_date semantics: raw value on parse failure, em dash
+        # when the field is empty
+        df[col] = parsed.dt.strftime(_FMT).where(
+            parsed.notna(), df[col].fillna("—")
+        )
+
+    # Display table with row selection so the action buttons below know
+    # which post they operate on (previously they could only ask the
+    # user to "select a post" with no way to actually do so)
+    event = st.dataframe(
         df,
         use_container_width=True,
         hide_index=True,
         key="posts_table",
+        on_select="rerun",
+        selection_mode="single-row",
     )
 
-    # Action buttons
+    selected_rows = event.selection.rows
+    if not selected_rows:
+        st.caption("Select a row to enable actions")
+        return None
+
+    selected_id = df.iloc[selected_rows[0]]["ID"]
+
+    # Action buttons, contextual to the selected row
     st.write("### Actions")
-    cols = st.columns(5)
+    cols = st.columns(4)
 
     with cols[0]:
-        if st.button("✅ Approve", use_container_width=True):
-            if on_approve:
-                # Would need post selection in real implementation
-                st.info("Select a post to approve")
+        if st.button("✅ Approve", use_container_width=True) and on_approve:
+            on_approve(selected_id)
 
     with cols[1]:
-        if st.button("❌ Reject", use_container_width=True):
-            if on_reject:
-                st.info("Select a post to reject")
+        if st.button("❌ Reject", use_container_width=True) and on_reject:
+            on_reject(selected_id)
 
     with cols[2]:
-        if st.button("✏️ Edit", use_container_width=True):
-            if on_edit:
-                st.info("Select a post to edit")
+        if st.button("✏️ Edit", use_container_width=True) and on_edit:
+            on_edit(selected_id)
 
     with cols[3]:
-        if st.button("🔄 Revise", use_container_width=True):
-            if on_revise:
-                st.info("Select a post to revise")
+        if st.button("🔄 Revise", use_container_width=True) and on_revise:
+            on_revise(selected_id)
 
-    with cols[4]:
-        if st.button("🖼️ Preview", use_container_width=True):
-            st.info("Select a post to preview")
-
-    return None
+    return selected_id
 
 
 def render_post_row(post: Dict) -> None:
@@ -148,12 +219,9 @@ def create_status_filter() -> Optional[str]:
     Returns:
         Selected status or None for all
     """
-    from config import POST_STATUSES
-
-    statuses = ["All"] + list(POST_STATUSES.keys())
     selected = st.selectbox(
         "Filter by Status:",
-        statuses,
+        _STATUS_OPTIONS,
         key="status_filter",
     )
 
@@ -189,22 +257,26 @@ def filter_posts(
     Returns:
         Filtered list of posts
     """
-    filtered = posts
+    query = search_query.lower().strip() if search_query and search_query.strip() else None
 
-    # Filter by status
-    if status:
-        filtered = [
-            p for p in filtered
-            if p.get("fields", {}).get("Status") == status
-        ]
+    if not status and query is None:
+        return posts
 
-    # Filter by search query
-    if search_query and search_query.strip():
-        query = search_query.lower().strip()
-        filtered = [
-            p for p in filtered
-            if query in p.get("fields", {}).get("Title", "").lower()
-            or query in p.get("fields", {}).get("Post Content", "").lower()
-        ]
+    # Single pass: unpack "fields" once per post instead of re-walking the
+    # nested dict for every predicate
+    filtered = []
+    for post in posts:
+        fields = post.get("fields") or {}
+
+        if status and fields.get("Status") != status:
+            continue
+
+        if query is not None and (
+            query not in fields.get("Title", "").lower()
+            and query not in fields.get("Post Content", "").lower()
+        ):
+            continue
+
+        filtered.append(post)
 
     return filtered
@@ -0,0 +1,75 @@
+"""
+Configuration for LinkedIn Post Manager
+Loads environment variables once and defines shared constants
+"""
+
+import os
+from pathlib import Path
+from types import MappingProxyType
+
+from dotenv import load_dotenv
+
+# Load the project .env exactly once per process. The old module computed
+# the same path twice (env_path/env_root) and stat'd + parsed the file
+# twice on every cold start.
+_ENV_PATH = Path(__file__).parent / ".env"
+if _ENV_PATH.exists():
+    load_dotenv(_ENV_PATH)
+
+# Supabase (primary backend - Plan B architecture)
+SUPABASE_URL = os.getenv("SUPABASE_URL", "")
+SUPABASE_KEY = os.getenv("SUPABASE_KEY", "")
+
+# Airtable (legacy backend, kept for the migration script and AirtableClient)
+AIRTABLE_API_KEY = os.getenv("AIRTABLE_API_KEY", "")
+AIRTABLE_BASE_ID = os.getenv("AIRTABLE_BASE_ID", "")
+AIRTABLE_LINKEDIN_TABLE_ID = os.getenv("AIRTABLE_LINKEDIN_TABLE_ID", "")
+AIRTABLE_API_URL = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/{AIRTABLE_LINKEDIN_TABLE_ID}"
+
+# Modal webhooks (legacy event-driven path)
+MODAL_WEBHOOK_BASE_URL = os.getenv("MODAL_WEBHOOK_BASE_URL", "")
+
+# Client-side cache TTL in seconds
+CACHE_TTL = int(os.getenv("CACHE_TTL", "30"))
+
+# Post lifecycle statuses - must match the CHECK constraint on
+# posts.status in supabase_schema.sql. Read-only views keep the
+# import-time derivations (status option tuples, badge maps) honest.
+POST_STATUSES = MappingProxyType({
+    "Draft": "Newly generated, awaiting review",
+    "Pending Review": "Updated or revised, awaiting approval",
+    "Approved - Ready to Schedule": "Approved, waiting for the scheduler cron",
+    "Scheduled": "Assigned a posting time slot",
+    "Posted": "Published to LinkedIn",
+    "Rejected": "Declined, deleted after 7 days",
+})
+
+# Badge/chart colors per status
+STATUS_COLORS = MappingProxyType({
+    "Draft": "#9AA0A6",
+    "Pending Review": "#F9AB00",
+    "Approved - Ready to Schedule": "#1967D2",
+    "Scheduled": "#188038",
+    "Posted": "#0A66C2",
+    "Rejected": "#D93025",
+})
+
+# Daily posting windows in UTC hours: 9 AM, 2 PM, 8 PM
+# (see MODAL_CRON_DEPLOYMENT.md)
+TIME_WINDOWS = (9, 14, 20)
+
+
+def validate_config() -> bool:
+    """
+    Validate that required configuration is present
+
+    Returns:
+        True if the app can talk to its backend, False otherwise
+    """
+    # Supabase is the live backend; Airtable/Modal settings are optional
+    # legacy paths and are validated by their own clients on first use
+    if not SUPABASE_URL or not SUPABASE_KEY:
+        print("❌ Missing SUPABASE_URL / SUPABASE_KEY in environment or .env")
+        return False
+
+    return True
@@ -52,6 +52,21 @@ CREATE INDEX IF NOT EXISTS posts_created_at_idx ON posts(created_at DESC);
 -- Create index on scheduled_time for date range queries
 CREATE INDEX IF NOT EXISTS posts_scheduled_time_idx ON posts(scheduled_time);
 
+-- Trigram index so the ilike search on title/content stays sub-linear
+-- as the table grows (requires the pg_trgm extension, available on
+-- Supabase by default)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS posts_title_trgm_idx
+  ON posts USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS posts_content_trgm_idx
+  ON posts USING gin (post_content gin_trgm_ops);
+
+-- Partial index for the scheduler's busy-time lookup: drafts and other
+-- rows without a scheduled_time never enter the index, so the range
+-- scan only touches rows that can actually conflict
+CREATE INDEX IF NOT EXISTS posts_scheduled_time_notnull_idx
+  ON posts(scheduled_time) WHERE scheduled_time IS NOT NULL;
+
 -- Enable Row Level Security (optional, for multi-user support)
 ALTER TABLE posts ENABLE ROW LEVEL SECURITY;
 
@@ -62,3 +77,59 @@ ALTER TABLE posts ENABLE ROW LEVEL SECURITY;
 -- Allow all operations for anonymous users (for public access)
 CREATE POLICY "Allow all operations" ON posts
 FOR ALL USING (true);
+
+-- Server-side scheduler: picks the earliest free slot in the posting
+-- windows (9/14/20 UTC, 30-minute clearance from any scheduled post)
+-- and writes it in the same transaction while holding a scheduler-wide
+-- advisory lock, so two concurrent schedulers can never choose
+-- overlapping times.
+-- The Python client calls this via rpc("schedule_post") and falls back
+-- to its client-side search if the function is not deployed.
+CREATE OR REPLACE FUNCTION schedule_post(p_record_id UUID)
+RETURNS TIMESTAMPTZ AS $$
+DECLARE
+  candidate TIMESTAMPTZ;
+BEGIN
+  -- Serialize slot selection across ALL schedulers. A per-row lock on
+  -- the target post is not enough: two calls for different posts would
+  -- lock different rows, run the candidate query concurrently without
+  -- seeing each other's uncommitted scheduled_time, and pick the same
+  -- slot. The advisory lock is released at transaction end, so the
+  -- winner's write is committed and visible before the next scheduler
+  -- starts its search.
+  PERFORM pg_advisory_xact_lock(hashtext('schedule_post'));
+
+  SELECT slot INTO candidate
+  FROM (
+    SELECT d + make_interval(hours => h, mins => m) AS slot
+    FROM generate_series(
+           date_trunc('day', now()),
+           date_trunc('day', now()) + interval '30 days',
+           interval '1 day'
+         ) AS d,
+         unnest(ARRAY[9, 14, 20]) AS h,
+         generate_series(0, 59) AS m
+  ) candidates
+  WHERE slot > now()
+    AND NOT EXISTS (
+      SELECT 1 FROM posts b
+      WHERE b.scheduled_time IS NOT NULL
+        AND b.scheduled_time BETWEEN slot - interval '30 minutes'
+                                 AND slot + interval '30 minutes'
+    )
+  ORDER BY slot
+  LIMIT 1;
+
+  IF candidate IS NULL THEN
+    RETURN NULL;
+  END IF;
+
+  UPDATE posts
+  SET status = 'Scheduled',
+      scheduled_time = candidate,
+      updated_at = now()
+  WHERE id = p_record_id;
+
+  RETURN candidate;
+END;
+$$ LANGUAGE plpgsql;
@@ -6,6 +6,7 @@ Run this before deployment to ensure everything is configured correctly
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add parent directory to path
@@ -63,13 +64,10 @@ def test_config():
     return True
 
 
-def test_airtable_connection():
+def test_airtable_connection(client):
     """Test Airtable API connectivity"""
     print("\n=== Testing Airtable Connection ===")
-    from utils.airtable_client import AirtableClient
-
     try:
-        client = AirtableClient()
         posts_count = client.get_posts_count()
         print(f"✅ Airtable connected! Found {posts_count} posts")
         return True
@@ -98,13 +96,10 @@ def test_modal_webhooks():
         return False
 
 
-def test_airtable_sample():
+def test_airtable_sample(client):
     """Test fetching sample posts from Airtable"""
     print("\n=== Testing Sample Data ===")
-    from utils.airtable_client import AirtableClient
-
     try:
-        client = AirtableClient()
         posts = client.get_all_posts()
 
         if posts:
@@ -129,16 +124,10 @@ def main():
     print("Streamlit LinkedIn Post Manager - Setup Verification")
     print("=" * 50)
 
-    tests = [
-        ("Imports", test_imports),
-        ("Configuration", test_config),
-        ("Airtable Connection", test_airtable_connection),
-        ("Modal Webhooks", test_modal_webhooks),
-        ("Sample Data", test_airtable_sample),
-    ]
-
+    # Local checks run first (and sequentially): there is no point
+    # hitting the network if imports or config are broken
     results = []
-    for name, test_func in tests:
+    for name, test_func in [("Imports", test_imports), ("Configuration", test_config)]:
         try:
             result = test_func()
             results.append((name, result))
@@ -146,6 +135,41 @@ def main():
             print(f"\n❌ Unexpected error in {name}: {e}")
             results.append((name, False))
 
+    # One shared client: both Airtable probes reuse its keep-alive
+    # session instead of each paying a fresh TCP+TLS handshake
+    try:
+        from utils.airtable_client import AirtableClient
+        airtable = AirtableClient()
+    except Exception as e:
+        print(f"\n❌ Failed to create AirtableClient: {e}")
+        airtable = None
+
+    # The network probes are independent, so run them concurrently:
+    # total wall-clock is the slowest probe, not the sum of all three.
+    # (Output from concurrent probes may interleave.)
+    network_tests = [
+        ("Airtable Connection", test_airtable_connection, (airtable,)),
+        ("Modal Webhooks", test_modal_webhooks, ()),
+        ("Sample Data", test_airtable_sample, (airtable,)),
+    ]
+
+    network_results = {}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(test_func, *args): name
+            for name, test_func, args in network_tests
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                network_results[name] = future.result()
+            except Exception as e:
+                print(f"\n❌ Unexpected error in {name}: {e}")
+                network_results[name] = False
+
+    # Report in the declared order regardless of completion order
+    results.extend((name, network_results[name]) for name, _, _ in network_tests)
+
     # Summary
     print("\n" + "=" * 50)
     print("SUMMARY")
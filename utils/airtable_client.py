@@ -3,12 +3,22 @@ Airtable API Client for LinkedIn Post Manager
 Handles all CRUD operations for posts stored in Airtable
 """
 
+import logging
 import requests
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 import time
 from config import AIRTABLE_API_URL, AIRTABLE_API_KEY, CACHE_TTL
 
+# orjson decodes JSON several times faster than the stdlib parser; it is
+# optional, so a missing install just falls back to response.json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 
 class AirtableClient:
     """Client for interacting with Airtable API"""
@@ -30,6 +40,51 @@ class AirtableClient:
         self.timeout = 10  # Request timeout in seconds
         self._cache: Dict[str, tuple] = {}  # Cache storage (key, (data, timestamp))
 
+        # Session gives us keep-alive: pagination and bulk updates reuse
+        # one TCP+TLS connection instead of handshaking per request.
+        # The retry policy absorbs Airtable's 5 req/s rate limit: 429s
+        # (and transient 5xx) are retried inside urllib3, honoring the
+        # Retry-After header, so burst pagination doesn't surface as an
+        # error to the UI
+        retry = requests.adapters.Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST", "PATCH", "DELETE"],
+            respect_retry_after_header=True,
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=20, max_retries=retry
+            ),
+        )
+
+    def _cache_get(self, key: str, ttl: Optional[int] = None) -> Optional[Any]:
+        """
+        Return a cached value if it is younger than its TTL
+
+        Args:
+            key: Cache key
+            ttl: Max age in seconds (defaults to CACHE_TTL)
+
+        Returns:
+            Cached data or None on miss/expiry
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        data, timestamp = entry
+        if time.time() - timestamp < (ttl if ttl is not None else CACHE_TTL):
+            return data
+        return None
+
+    def _cache_set(self, key: str, data: Any) -> None:
+        """Store a value in the cache with the current timestamp"""
+        self._cache[key] = (data, time.time())
+
     def _make_request(
         self,
         method: str,
@@ -55,26 +110,19 @@ class AirtableClient:
         url = f"{self.api_url}/{endpoint}" if endpoint else self.api_url
 
         try:
-            if method == "GET":
-                response = requests.get(
-                    url, headers=self.headers, params=params, timeout=self.timeout
-                )
-            elif method == "POST":
-                response = requests.post(
-                    url, headers=self.headers, json=json_data, timeout=self.timeout
-                )
-            elif method == "PATCH":
-                response = requests.patch(
-                    url, headers=self.headers, json=json_data, timeout=self.timeout
-                )
-            elif method == "DELETE":
-                response = requests.delete(
-                    url, headers=self.headers, timeout=self.timeout
-                )
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
+            # session.request handles every verb uniformly, so new
+            # methods need no new branch and params/json are never
+            # silently dropped for a verb that didn't pass them before
+            response = self.session.request(
+                method,
+                url,
+                params=params,
+                json=json_data,
+                timeout=self.timeout,
+            )
             response.raise_for_status()
+            if orjson is not None:
+                return orjson.loads(response.content)
             return response.json()
 
         except requests.exceptions.Timeout:
@@ -94,31 +142,30 @@ class AirtableClient:
         """
         # Check cache first
         cache_key = f"all_posts_{status_filter}"
-        if cache_key in self._cache:
-            data, timestamp = self._cache[cache_key]
-            if time.time() - timestamp < CACHE_TTL:
-                return data
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             records = []
             offset = None
 
+            # Push the status predicate down to Airtable so only matching
+            # records (and pages) come back, instead of downloading the
+            # whole table and filtering in Python
+            base_params = {"pageSize": 100}
+            if status_filter:
+                escaped = status_filter.replace("'", "\\'")
+                base_params["filterByFormula"] = f"{{Status}}='{escaped}'"
+
             # Paginate through all records
             while True:
-                params = {}
+                params = dict(base_params)
                 if offset:
                     params["offset"] = offset
 
                 response = self._make_request("GET", params=params)
-
-                if "records" in response:
-                    for record in response["records"]:
-                        # Apply status filter if specified
-                        if status_filter:
-                            if record.get("fields", {}).get("Status") == status_filter:
-                                records.append(record)
-                        else:
-                            records.append(record)
+                records.extend(response.get("records", []))
 
                 # Check if more records exist
                 offset = response.get("offset")
@@ -126,11 +173,11 @@ class AirtableClient:
                     break
 
             # Cache the result
-            self._cache[cache_key] = (records, time.time())
+            self._cache_set(cache_key, records)
             return records
 
         except Exception as e:
-            print(f"Error fetching posts: {e}")
+            logger.error("Error fetching posts: %s", e)
             return []
 
     def get_post(self, record_id: str) -> Optional[Dict]:
@@ -147,7 +194,7 @@ class AirtableClient:
             response = self._make_request("GET", endpoint=record_id)
             return response
         except Exception as e:
-            print(f"Error fetching post {record_id}: {e}")
+            logger.error("Error fetching post %s: %s", record_id, e)
             return None
 
     def update_post(self, record_id: str, fields: Dict[str, Any]) -> Dict:
@@ -170,7 +217,7 @@ class AirtableClient:
 
             return response
         except Exception as e:
-            print(f"Error updating post {record_id}: {e}")
+            logger.error("Error updating post %s: %s", record_id, e)
             raise
 
     def update_status(self, record_id: str, new_status: str) -> Dict:
@@ -186,6 +233,84 @@ class AirtableClient:
         """
         return self.update_post(record_id, {"Status": new_status})
 
+    def update_posts_bulk(self, updates: List[tuple]) -> List[Dict]:
+        """
+        Update many posts in batches of 10 records per PATCH
+
+        Airtable's batch endpoint takes up to 10 records per call, so N
+        single-record PATCHes collapse into ceil(N/10) round-trips.
+
+        Args:
+            updates: List of (record_id, fields) tuples
+
+        Returns:
+            List of updated record data from all batches
+        """
+        if not updates:
+            return []
+
+        try:
+            updated = []
+            for i in range(0, len(updates), 10):
+                chunk = updates[i : i + 10]
+                payload = {
+                    "records": [
+                        {"id": record_id, "fields": fields}
+                        for record_id, fields in chunk
+                    ]
+                }
+                response = self._make_request("PATCH", json_data=payload)
+                updated.extend(response.get("records", []))
+
+            # Invalidate cache
+            self._clear_cache()
+
+            return updated
+        except Exception as e:
+            logger.error("Error bulk-updating %d posts: %s", len(updates), e)
+            raise
+
+    def update_status_bulk(self, record_ids: List[str], new_status: str) -> List[Dict]:
+        """
+        Convenience method to set the same status on many posts at once
+
+        Args:
+            record_ids: List of Airtable record IDs
+            new_status: New status value
+
+        Returns:
+            List of updated record data
+        """
+        return self.update_posts_bulk(
+            [(record_id, {"Status": new_status}) for record_id in record_ids]
+        )
+
+    def delete_posts_bulk(self, record_ids: List[str]) -> bool:
+        """
+        Delete many posts in batches of 10 records per DELETE
+
+        Args:
+            record_ids: List of Airtable record IDs
+
+        Returns:
+            True if all batches succeeded
+        """
+        if not record_ids:
+            return True
+
+        try:
+            for i in range(0, len(record_ids), 10):
+                chunk = record_ids[i : i + 10]
+                self._make_request("DELETE", params={"records[]": chunk})
+
+            # Invalidate cache
+            self._clear_cache()
+
+            return True
+        except Exception as e:
+            logger.error("Error bulk-deleting %d posts: %s", len(record_ids), e)
+            return False
+
     def request_revision(
         self, record_id: str, prompt: str, revision_type: str = "Both"
     ) -> Dict:
@@ -223,33 +348,40 @@ class AirtableClient:
         cache_key = f"scheduled_{start_date.date()}_{end_date.date()}"
 
         # Check cache first (shorter 15s TTL for date-range queries)
-        if cache_key in self._cache:
-            data, timestamp = self._cache[cache_key]
-            if time.time() - timestamp < 15:
-                return data
+        cached = self._cache_get(cache_key, ttl=15)
+        if cached is not None:
+            return cached
 
         try:
-            all_posts = self.get_all_posts(status_filter="Scheduled")
+            # Push both predicates down to Airtable: only scheduled posts
+            # inside the (inclusive) range come back, so no per-record
+            # ISO parsing happens here at all
+            formula = (
+                "AND({Status}='Scheduled',"
+                f"NOT(IS_BEFORE({{Scheduled Time}},'{start_date.isoformat()}')),"
+                f"NOT(IS_AFTER({{Scheduled Time}},'{end_date.isoformat()}')))"
+            )
+
             scheduled = []
+            offset = None
 
-            for post in all_posts:
-                scheduled_time_str = post.get("fields", {}).get("Scheduled Time")
-                if scheduled_time_str:
-                    try:
-                        # Parse ISO format timestamp
-                        scheduled_time = datetime.fromisoformat(
-                            scheduled_time_str.replace("Z", "+00:00")
-                        )
-                        if start_date <= scheduled_time <= end_date:
-                            scheduled.append(post)
-                    except ValueError:
-                        continue
+            while True:
+                params = {"filterByFormula": formula, "pageSize": 100}
+                if offset:
+                    params["offset"] = offset
+
+                response = self._make_request("GET", params=params)
+                scheduled.extend(response.get("records", []))
+
+                offset = response.get("offset")
+                if not offset:
+                    break
 
             # Cache the result
-            self._cache[cache_key] = (scheduled, time.time())
+            self._cache_set(cache_key, scheduled)
             return scheduled
         except Exception as e:
-            print(f"Error fetching scheduled posts: {e}")
+            logger.error("Error fetching scheduled posts: %s", e)
             return []
 
     def create_post(self, fields: Dict[str, Any]) -> Dict:
@@ -271,7 +403,7 @@ class AirtableClient:
 
             return response
         except Exception as e:
-            print(f"Error creating post: {e}")
+            logger.error("Error creating post: %s", e)
             raise
 
     def delete_post(self, record_id: str) -> bool:
@@ -292,7 +424,7 @@ class AirtableClient:
 
             return True
         except Exception as e:
-            print(f"Error deleting post {record_id}: {e}")
+            logger.error("Error deleting post %s: %s", record_id, e)
             return False
 
     def _clear_cache(self):
@@ -313,10 +445,9 @@ class AirtableClient:
         cache_key = f"posts_status_{'_'.join(sorted(statuses))}"
 
         # Check cache first (15s TTL for status queries)
-        if cache_key in self._cache:
-            data, timestamp = self._cache[cache_key]
-            if time.time() - timestamp < 15:
-                return data
+        cached = self._cache_get(cache_key, ttl=15)
+        if cached is not None:
+            return cached
 
         try:
             all_posts = self.get_all_posts()
@@ -326,22 +457,44 @@ class AirtableClient:
             ]
 
             # Cache the result
-            self._cache[cache_key] = (matching, time.time())
+            self._cache_set(cache_key, matching)
             return matching
         except Exception as e:
-            print(f"Error fetching posts by status: {e}")
+            logger.error("Error fetching posts by status: %s", e)
             return []
 
     def get_posts_count(self) -> int:
         """
-        Get total count of posts in database
+        Get total count of posts in database (60-second cache)
+
+        Counts by paginating with a single tiny field instead of
+        downloading every column of every record just to take len().
 
         Returns:
             Number of posts
         """
+        cached = self._cache_get("posts_count", ttl=60)
+        if cached is not None:
+            return cached
+
         try:
-            all_posts = self.get_all_posts()
-            return len(all_posts)
+            count = 0
+            offset = None
+
+            while True:
+                params = {"fields[]": "Status", "pageSize": 100}
+                if offset:
+                    params["offset"] = offset
+
+                response = self._make_request("GET", params=params)
+                count += len(response.get("records", []))
+
+                offset = response.get("offset")
+                if not offset:
+                    break
+
+            self._cache_set("posts_count", count)
+            return count
         except Exception as e:
-            print(f"Error getting posts count: {e}")
+            logger.error("Error getting posts count: %s", e)
             return 0
@@ -4,11 +4,61 @@ Eliminates Modal webhook dependency for synchronous operations
 """
 
 import requests
+import logging
 import os
+import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import time
 import json
 
+logger = logging.getLogger(__name__)
+
+# Model routing: the user-visible revision keeps the best model, while
+# the change-summary and image-prompt calls go to a much smaller model —
+# their quality demands are modest and the smaller model is severalfold
+# faster and cheaper. Constants so ops can swap models without touching
+# call sites.
+REVISION_MODEL = "claude-opus-4-5-20251101"
+SUMMARY_MODEL = "claude-3-5-haiku-20241022"
+PROMPT_MODEL = "claude-3-5-haiku-20241022"
+
+# In-flight coalescing: Streamlit reruns can fire the same multi-minute
+# operation twice in quick succession (e.g. a double click), each one
+# launching its own Replicate job or Claude revision. Concurrent calls
+# for the same record share a single Future instead.
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+_INFLIGHT_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+
+def _coalesce(key: str, func, *args) -> Dict[str, Any]:
+    """Run func(*args), sharing one in-flight call per key
+
+    The first caller for a key submits the work; callers arriving while
+    it is still running block on the same Future and get the same
+    result. The entry is dropped on completion, so a later trigger for
+    the same record runs fresh.
+    """
+    created = False
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        if future is None:
+            future = _INFLIGHT_EXECUTOR.submit(func, *args)
+            _INFLIGHT[key] = future
+            created = True
+
+    if created:
+        def _cleanup(_future, key=key):
+            with _INFLIGHT_LOCK:
+                _INFLIGHT.pop(key, None)
+
+        future.add_done_callback(_cleanup)
+
+    return future.result()
+
 # Try to import Streamlit for secrets
 try:
     import streamlit as st
@@ -17,8 +67,13 @@ except ImportError:
     _STREAMLIT_AVAILABLE = False
 
 
+@lru_cache(maxsize=32)
 def _get_secret(key: str, default: str = "") -> str:
-    """Get secret from Streamlit secrets or environment variables"""
+    """Get secret from Streamlit secrets or environment variables
+
+    Memoized: secrets don't change within a process, and st.secrets
+    access is not free, so repeat lookups become a dict hit.
+    """
     if _STREAMLIT_AVAILABLE:
         try:
             return st.secrets.get(key) or os.getenv(key, default)
@@ -40,6 +95,15 @@ class ReplicateClient:
             "Content-Type": "application/json"
         }
 
+        # Session keep-alive: the poll loop issues up to 60 GETs per
+        # image, and without it each one pays a fresh TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10),
+        )
+
     def generate_image(self, prompt: str) -> Optional[str]:
         """
         Generate image using Google's Nano Banana Pro model via Replicate API
@@ -60,9 +124,8 @@ class ReplicateClient:
             }
 
             # Submit prediction
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/predictions",
-                headers=self.headers,
                 json=prediction_payload,
                 timeout=30
             )
@@ -76,14 +139,16 @@ class ReplicateClient:
             if not prediction_id:
                 raise Exception(f"No prediction ID returned: {prediction}")
 
-            # Poll for completion (max 5 minutes)
-            max_polls = 60
-            poll_count = 0
+            # Poll for completion (max 5 minutes of wall time).
+            # Exponential backoff with full jitter: short jobs are
+            # noticed quickly, long jobs aren't over-polled, and
+            # concurrent sessions don't hit the API in lockstep
+            deadline = time.monotonic() + 300
+            attempt = 0
 
-            while poll_count < max_polls:
-                response = requests.get(
+            while time.monotonic() < deadline:
+                response = self.session.get(
                     f"{self.base_url}/predictions/{prediction_id}",
-                    headers=self.headers,
                     timeout=30
                 )
 
@@ -108,8 +173,8 @@ class ReplicateClient:
                     raise Exception(f"Image generation failed: {error}")
 
                 # Still processing, wait and retry
-                poll_count += 1
-                time.sleep(5)
+                attempt += 1
+                time.sleep(random.uniform(0, min(15.0, 2.0 ** attempt)))
 
             raise Exception("Image generation timed out after 5 minutes")
 
@@ -119,6 +184,26 @@ class ReplicateClient:
             raise Exception(f"Image generation error: {str(e)}")
 
 
+_replicate_client: Optional["ReplicateClient"] = None
+
+
+def get_replicate_client() -> "ReplicateClient":
+    """
+    Return a shared ReplicateClient instance
+
+    Constructing one per generation re-reads secrets and rebuilds the
+    auth headers each time; a module-level instance keeps one client
+    (and its HTTP connection reuse) for the process lifetime.
+
+    Returns:
+        The shared ReplicateClient
+    """
+    global _replicate_client
+    if _replicate_client is None:
+        _replicate_client = ReplicateClient()
+    return _replicate_client
+
+
 class ClaudeClient:
     """Direct client for Claude API for content revision"""
 
@@ -133,6 +218,15 @@ class ClaudeClient:
             "anthropic-version": "2023-06-01"
         }
 
+        # Keep-alive session: revision flows make back-to-back calls
+        # that can share one TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10),
+        )
+
     def revise_content(self, original_content: str, revision_prompt: str) -> Dict[str, str]:
         """
         Revise post content using Claude API
@@ -163,7 +257,7 @@ Revision request:
 Please revise the post according to the feedback."""
 
             payload = {
-                "model": "claude-opus-4-5-20251101",  # Use best model for quality
+                "model": REVISION_MODEL,  # Use best model for quality
                 "max_tokens": 1024,
                 "system": system_prompt,
                 "messages": [
@@ -171,9 +265,8 @@ Please revise the post according to the feedback."""
                 ]
             }
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/messages",
-                headers=self.headers,
                 json=payload,
                 timeout=30
             )
@@ -187,17 +280,16 @@ Please revise the post according to the feedback."""
 
             # Generate change summary
             summary_payload = {
-                "model": "claude-opus-4-5-20251101",
-                "max_tokens": 256,
+                "model": SUMMARY_MODEL,
+                "max_tokens": 128,
                 "system": "Summarize what changed in the revision in 1-2 sentences.",
                 "messages": [
                     {"role": "user", "content": f"Original: {original_content}\n\nRevised: {revised_content}"}
                 ]
             }
 
-            summary_response = requests.post(
+            summary_response = self.session.post(
                 f"{self.base_url}/messages",
-                headers=self.headers,
                 json=summary_payload,
                 timeout=30
             )
@@ -221,6 +313,10 @@ def generate_image_from_post(airtable_client, record_id: str) -> Dict[str, Any]:
     """
     Generate image for a post directly using Replicate API
 
+    Duplicate triggers for the same record while a generation is in
+    flight share the running call rather than starting a second
+    Replicate job.
+
     Args:
         airtable_client: Airtable client to fetch post and update results
         record_id: Airtable record ID
@@ -228,6 +324,13 @@ def generate_image_from_post(airtable_client, record_id: str) -> Dict[str, Any]:
     Returns:
         Response dict with success status and image_url
     """
+    return _coalesce(
+        f"image:{record_id}", _generate_image_from_post, airtable_client, record_id
+    )
+
+
+def _generate_image_from_post(airtable_client, record_id: str) -> Dict[str, Any]:
+    """Do the actual fetch → prompt → generate → update work"""
     try:
         # Fetch post from Airtable
         post = airtable_client.get_post(record_id)
@@ -244,7 +347,7 @@ def generate_image_from_post(airtable_client, record_id: str) -> Dict[str, Any]:
         claude = ClaudeClient()
         try:
             prompt_payload = {
-                "model": "claude-opus-4-5-20251101",
+                "model": PROMPT_MODEL,
                 "max_tokens": 150,
                 "system": "Create a detailed, visual image prompt for DALL-E based on this LinkedIn post content. Focus on visual elements, mood, and style.",
                 "messages": [
@@ -252,9 +355,8 @@ def generate_image_from_post(airtable_client, record_id: str) -> Dict[str, Any]:
                 ]
             }
 
-            prompt_response = requests.post(
-                "https://api.anthropic.com/v1/messages",
-                headers=claude.headers,
+            prompt_response = claude.session.post(
+                f"{claude.base_url}/messages",
                 json=prompt_payload,
                 timeout=30
             )
@@ -265,8 +367,8 @@ def generate_image_from_post(airtable_client, record_id: str) -> Dict[str, Any]:
             # Fallback: use simplified prompt if Claude fails
             image_prompt = f"Professional LinkedIn post illustration: {content[:100]}"
 
-        # Generate image
-        replicate = ReplicateClient()
+        # Generate image (shared client, see get_replicate_client)
+        replicate = get_replicate_client()
         image_url = replicate.generate_image(image_prompt)
 
         if not image_url:
@@ -274,14 +376,16 @@ def generate_image_from_post(airtable_client, record_id: str) -> Dict[str, Any]:
 
         # Update Airtable with image URL
         try:
-            print(f"[DEBUG] Updating post {record_id} with image URL: {image_url[:50]}...")
+            # Lazy %s formatting: the strings are only built when debug
+            # logging is actually enabled
+            logger.debug("Updating post %s with image URL: %.50s...", record_id, image_url)
             update_result = airtable_client.update_post(record_id, {
                 "Image URL": image_url,
                 "Status": "Pending Review"
             })
-            print(f"[DEBUG] Update successful: {update_result}")
+            logger.debug("Update successful: %s", update_result)
         except Exception as update_error:
-            print(f"[ERROR] Failed to update post: {str(update_error)}")
+            logger.error("Failed to update post %s: %s", record_id, update_error)
             return {
                 "success": False,
                 "error": f"Failed to save image to database: {str(update_error)}",
@@ -295,7 +399,7 @@ def generate_image_from_post(airtable_client, record_id: str) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"[ERROR] generate_image_from_post failed: {str(e)}")
+        logger.error("generate_image_from_post failed: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -307,6 +411,9 @@ def revise_post_content(airtable_client, record_id: str) -> Dict[str, Any]:
     """
     Revise post content directly using Claude API
 
+    Duplicate triggers for the same record while a revision is in
+    flight share the running call instead of paying for a second one.
+
     Args:
         airtable_client: Airtable client to fetch post and update results
         record_id: Airtable record ID (must have Revision Prompt set)
@@ -314,6 +421,13 @@ def revise_post_content(airtable_client, record_id: str) -> Dict[str, Any]:
     Returns:
         Response dict with success status and changes
     """
+    return _coalesce(
+        f"revise:{record_id}", _revise_post_content, airtable_client, record_id
+    )
+
+
+def _revise_post_content(airtable_client, record_id: str) -> Dict[str, Any]:
+    """Do the actual fetch → revise → update work"""
     try:
         # Fetch post from Airtable
         post = airtable_client.get_post(record_id)
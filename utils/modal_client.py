@@ -3,10 +3,19 @@ Modal Webhook Client for LinkedIn Post Manager
 Triggers Modal functions directly via HTTP webhooks instead of polling
 """
 
+import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Any
 from config import MODAL_WEBHOOK_BASE_URL
 
+logger = logging.getLogger(__name__)
+
+# Shared pool for fire-and-forget triggers. Module level so the threads
+# survive the Streamlit rerun that queued them and the POST completes
+# even after the caller has moved on.
+_WEBHOOK_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
 
 class ModalClient:
     """Client for triggering Modal webhook functions"""
@@ -22,13 +31,41 @@ class ModalClient:
         self.timeout = 30  # 30 second timeout for Modal execution
         self.headers = {"Content-Type": "application/json"}
 
-    def _trigger_webhook(self, endpoint: str, record_id: str) -> Dict[str, Any]:
+        # Keep-alive session shared across webhook triggers
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10),
+        )
+
+    def _post_in_background(self, url: str, payload: Dict[str, Any]) -> None:
+        """
+        POST a webhook payload from a background thread
+
+        Connect timeout stays short so an unreachable host fails fast;
+        the read side is unbounded because the work may legitimately run
+        longer than the synchronous 30s budget. The outcome lands in the
+        database via Modal, not here, so failures are only logged.
+        """
+        try:
+            self.session.post(url, json=payload, timeout=(3, None))
+        except Exception as e:
+            logger.error("Background webhook %s failed: %s", url, e)
+
+    def _trigger_webhook(
+        self, endpoint: str, record_id: str, async_mode: bool = False
+    ) -> Dict[str, Any]:
         """
         Make HTTP POST request to Modal webhook
 
         Args:
             endpoint: Webhook endpoint (e.g., "schedule", "generate-image")
             record_id: Airtable record ID to process
+            async_mode: When True, queue the POST on a background thread
+                and return a 202-style response immediately instead of
+                blocking up to 30s on Modal. The completed result shows
+                up in the database on the next data refresh.
 
         Returns:
             Response data with success status and result
@@ -36,11 +73,20 @@ class ModalClient:
         url = f"{self.base_url}/{endpoint}"
         payload = {"record_id": record_id}
 
+        if async_mode:
+            _WEBHOOK_EXECUTOR.submit(self._post_in_background, url, payload)
+            return {
+                "success": True,
+                "queued": True,
+                "status_code": 202,
+                "data": {},
+                "error": None,
+            }
+
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 json=payload,
-                headers=self.headers,
                 timeout=self.timeout,
             )
 
@@ -74,7 +120,7 @@ class ModalClient:
                 "error": f"Unexpected error: {str(e)}",
             }
 
-    def trigger_image_generation(self, record_id: str) -> Dict[str, Any]:
+    def trigger_image_generation(self, record_id: str, async_mode: bool = False) -> Dict[str, Any]:
         """
         Trigger image generation for a specific post
 
@@ -86,11 +132,13 @@ class ModalClient:
 
         Args:
             record_id: Airtable record ID
+            async_mode: Queue the trigger in the background and return
+                immediately instead of waiting for the image
 
         Returns:
             Response dict with success status and image URL or error
         """
-        response = self._trigger_webhook("generate-image", record_id)
+        response = self._trigger_webhook("generate-image", record_id, async_mode)
 
         if response["success"]:
             response["message"] = "Image generation triggered successfully"
@@ -99,7 +147,7 @@ class ModalClient:
 
         return response
 
-    def trigger_scheduling(self, record_id: str) -> Dict[str, Any]:
+    def trigger_scheduling(self, record_id: str, async_mode: bool = False) -> Dict[str, Any]:
         """
         Trigger auto-scheduling for approved post
 
@@ -111,11 +159,13 @@ class ModalClient:
 
         Args:
             record_id: Airtable record ID
+            async_mode: Queue the trigger in the background and return
+                immediately instead of waiting for the slot
 
         Returns:
             Response dict with success status and scheduled time or error
         """
-        response = self._trigger_webhook("schedule", record_id)
+        response = self._trigger_webhook("schedule", record_id, async_mode)
 
         if response["success"]:
             response["message"] = "Post scheduled successfully"
@@ -124,7 +174,7 @@ class ModalClient:
 
         return response
 
-    def trigger_revision(self, record_id: str) -> Dict[str, Any]:
+    def trigger_revision(self, record_id: str, async_mode: bool = False) -> Dict[str, Any]:
         """
         Trigger revision processing for a post
 
@@ -138,11 +188,13 @@ class ModalClient:
 
         Args:
             record_id: Airtable record ID
+            async_mode: Queue the trigger in the background and return
+                immediately instead of waiting for the revision
 
         Returns:
             Response dict with success status and revision changes or error
         """
-        response = self._trigger_webhook("revise", record_id)
+        response = self._trigger_webhook("revise", record_id, async_mode)
 
         if response["success"]:
             response["message"] = "Revision processed successfully"
@@ -151,7 +203,7 @@ class ModalClient:
 
         return response
 
-    def trigger_rejection(self, record_id: str) -> Dict[str, Any]:
+    def trigger_rejection(self, record_id: str, async_mode: bool = False) -> Dict[str, Any]:
         """
         Trigger rejection handling for a post
 
@@ -162,11 +214,13 @@ class ModalClient:
 
         Args:
             record_id: Airtable record ID
+            async_mode: Queue the trigger in the background and return
+                immediately instead of waiting for the rejection
 
         Returns:
             Response dict with success status and deletion date or error
         """
-        response = self._trigger_webhook("reject", record_id)
+        response = self._trigger_webhook("reject", record_id, async_mode)
 
         if response["success"]:
             response["message"] = "Post rejected successfully"
@@ -184,7 +238,7 @@ class ModalClient:
         """
         try:
             url = self.base_url
-            response = requests.head(url, timeout=5)
+            response = self.session.head(url, timeout=5)
             return {
                 "success": True,
                 "message": "Modal webhooks accessible",
@@ -5,10 +5,47 @@ Drop-in replacement for Airtable with unlimited API requests
 
 from supabase import create_client, Client
 from typing import List, Dict, Optional, Any
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import bisect
+import hashlib
+import logging
+import random
+import sys
 import time
 import os
 
+from config import TIME_WINDOWS
+
+logger = logging.getLogger(__name__)
+
+_now_cache = (0, "")  # (epoch second, formatted ISO string)
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO string, cached within the same second
+
+    updated_at/created_at only need second precision, so calls landing
+    in the same second (bulk writes, batch scheduling) reuse one
+    formatted string instead of allocating a new one per row. Also
+    avoids the utcnow() API, deprecated since Python 3.12.
+    """
+    global _now_cache
+    second = int(time.time())
+    if second != _now_cache[0]:
+        _now_cache = (
+            second,
+            datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        )
+    return _now_cache[1]
+
+# datetime.fromisoformat parses a trailing "Z" natively on Python 3.11+;
+# only older versions need the replace() allocation per parse
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(date_str: str) -> datetime:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+
 
 class SupabaseClient:
     """Client for interacting with Supabase PostgreSQL database"""
@@ -34,6 +71,22 @@ class SupabaseClient:
     # Reverse mapping: Airtable PascalCase → Supabase snake_case
     REVERSE_FIELD_MAP = {v: k for k, v in FIELD_MAP.items()}
 
+    # Frozen (supabase_key, airtable_key) pairs so the per-record
+    # transform iterates a tuple instead of calling FIELD_MAP.get per
+    # field
+    _FIELD_ITEMS = tuple(FIELD_MAP.items())
+
+    # Explicit column list instead of "*": new/unknown columns never
+    # silently inflate the payload, and PostgREST can skip them entirely
+    _ALL_COLUMNS = "id," + ",".join(FIELD_MAP.keys())
+
+    # Minimal projection for list views that never render post bodies
+    _SUMMARY_COLUMNS = "id,title,status,scheduled_time"
+
+    # PostgREST caps un-ranged selects (typically at 1000 rows) and
+    # truncates silently; page in this size explicitly instead
+    _PAGE_SIZE = 1000
+
     def __init__(self, supabase_url: str = None, supabase_key: str = None):
         """
         Initialize Supabase client with credentials
@@ -74,17 +127,96 @@ class SupabaseClient:
         self._cache: Dict[str, tuple] = {}
         self.cache_ttl = 30  # 30 seconds cache
 
-        # Verify field mapping is working
-        print(f"[DEBUG] SupabaseClient initialized")
-        print(f"[DEBUG] REVERSE_FIELD_MAP sample: 'Image URL' → '{self.REVERSE_FIELD_MAP.get('Image URL')}'")
-        print(f"[DEBUG] REVERSE_FIELD_MAP sample: 'Post Content' → '{self.REVERSE_FIELD_MAP.get('Post Content')}'")
-        print(f"[DEBUG] REVERSE_FIELD_MAP sample: 'Status' → '{self.REVERSE_FIELD_MAP.get('Status')}'")
-        print(f"[DEBUG] Total fields mapped: {len(self.REVERSE_FIELD_MAP)}")
+        # Verify field mapping is working (lazy %s args: nothing is
+        # formatted unless debug logging is actually enabled)
+        logger.debug("SupabaseClient initialized")
+        logger.debug(
+            "REVERSE_FIELD_MAP sample: 'Image URL' → %r",
+            self.REVERSE_FIELD_MAP.get("Image URL"),
+        )
+        logger.debug("Total fields mapped: %d", len(self.REVERSE_FIELD_MAP))
 
     def _clear_cache(self):
         """Clear all cached data"""
         self._cache.clear()
 
+    def _cache_get(self, key: str, ttl: Optional[int] = None) -> Optional[Any]:
+        """
+        Return a cached value if it is younger than its TTL
+
+        Args:
+            key: Cache key
+            ttl: Max age in seconds (defaults to self.cache_ttl)
+
+        Returns:
+            Cached data or None on miss/expiry
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        data, timestamp = entry
+        if time.time() - timestamp < (ttl if ttl is not None else self.cache_ttl):
+            return data
+        return None
+
+    def _cache_set(self, key: str, data: Any) -> None:
+        """Store a value in the cache with the current timestamp"""
+        self._cache[key] = (data, time.time())
+
+    def _invalidate_record(self, record_id: str) -> None:
+        """
+        Drop one record from every cached list without expiring the rest
+
+        Deleting a post doesn't stale the other cached rows, so cached
+        lists are patched in place (and cached counts decremented)
+        instead of clearing everything and triggering a full refetch on
+        the next rerun.
+
+        Args:
+            record_id: Post ID to remove from cached results
+        """
+        self._cache.pop(f"post_{record_id}", None)
+        for key, (data, timestamp) in list(self._cache.items()):
+            if isinstance(data, list):
+                pruned = [r for r in data if r.get("id") != record_id]
+                if len(pruned) != len(data):
+                    self._cache[key] = (pruned, timestamp)
+            elif key.startswith("posts_count") and isinstance(data, int):
+                self._cache[key] = (max(data - 1, 0), timestamp)
+
+    def _patch_record(self, record_id: str, supabase_fields: Dict[str, Any]) -> None:
+        """
+        Merge a write into cached entries instead of clearing them
+
+        A status change moves the record between filtered lists, which
+        can't be patched locally, so that still clears everything. Any
+        other field update merges into the per-record entry and cached
+        list rows in place, keeping warm caches warm.
+
+        Args:
+            record_id: Post ID that was written
+            supabase_fields: snake_case fields sent in the update
+        """
+        if "status" in supabase_fields:
+            self._clear_cache()
+            return
+
+        airtable_fields = {
+            self.FIELD_MAP.get(key, key): value
+            for key, value in supabase_fields.items()
+        }
+
+        entry = self._cache.get(f"post_{record_id}")
+        if entry is not None:
+            entry[0]["fields"].update(airtable_fields)
+
+        for data, _ in self._cache.values():
+            if isinstance(data, list):
+                for record in data:
+                    if record.get("id") == record_id:
+                        record["fields"].update(airtable_fields)
+                        break
+
     def _to_airtable_format(self, record: Dict) -> Dict:
         """
         Convert Supabase record to Airtable format for compatibility.
@@ -97,12 +229,20 @@ class SupabaseClient:
         Returns:
             Airtable-formatted record
         """
-        fields = {}
-        for supabase_key, value in record.items():
-            if supabase_key == "id":
-                continue  # id stays at top level
-            airtable_key = self.FIELD_MAP.get(supabase_key, supabase_key)
-            fields[airtable_key] = value
+        # One comprehension over the precomputed key pairs: no per-field
+        # FIELD_MAP.get call, and missing columns (projected-out or
+        # null-skipped) simply don't appear
+        fields = {
+            airtable_key: record[supabase_key]
+            for supabase_key, airtable_key in self._FIELD_ITEMS
+            if supabase_key in record
+        }
+
+        # Unmapped columns pass through under their own names
+        field_map = self.FIELD_MAP
+        for key, value in record.items():
+            if key != "id" and key not in field_map:
+                fields[key] = value
 
         return {
             "id": record.get("id"),
@@ -111,52 +251,118 @@ class SupabaseClient:
 
     def _to_airtable_format_batch(self, records: List[Dict]) -> List[Dict]:
         """Convert list of records to Airtable format"""
-        return [self._to_airtable_format(record) for record in records]
+        # Bind the method once: repeat lookups stay out of the hot loop
+        convert = self._to_airtable_format
+        return [convert(record) for record in records]
 
-    def get_all_posts(self, status_filter: Optional[str] = None) -> List[Dict]:
+    def get_all_posts(
+        self, status_filter: Optional[str] = None, columns: Optional[str] = None
+    ) -> List[Dict]:
         """
         Fetch all posts from Supabase, optionally filtered by status
 
         Args:
             status_filter: Optional status to filter by
+            columns: Optional PostgREST column projection; defaults to
+                every mapped column. Callers that only render a list
+                can pass a narrower projection (or use
+                get_post_summaries) to avoid shipping the post bodies.
 
         Returns:
             List of post records in Airtable format
         """
+        projection = columns or self._ALL_COLUMNS
+
         # Check cache first
-        cache_key = f"all_posts_{status_filter}"
-        if cache_key in self._cache:
-            data, timestamp = self._cache[cache_key]
-            if time.time() - timestamp < self.cache_ttl:
-                return data
+        cache_key = f"all_posts_{status_filter}_{projection}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            if status_filter:
-                response = (
+            # Page through explicitly: without .range() PostgREST stops
+            # at its default row limit and truncates without warning
+            records = []
+            start = 0
+            while True:
+                query = (
                     self.client.table("posts")
-                    .select("*")
-                    .eq("status", status_filter)
+                    .select(projection)
                     .order("created_at", desc=True)
-                    .execute()
+                    .range(start, start + self._PAGE_SIZE - 1)
                 )
-            else:
-                response = (
+                if status_filter:
+                    query = query.eq("status", status_filter)
+
+                page = query.execute().data or []
+                records.extend(page)
+
+                if len(page) < self._PAGE_SIZE:
+                    break
+                start += self._PAGE_SIZE
+
+            # Convert to Airtable format for compatibility
+            formatted_records = self._to_airtable_format_batch(records)
+
+            # Cache the result, and seed the per-record entries so a
+            # get_post right after listing is a dict lookup. Narrowed
+            # projections don't seed: a partial row must not satisfy a
+            # later full-record get_post
+            self._cache_set(cache_key, formatted_records)
+            if projection == self._ALL_COLUMNS:
+                for record in formatted_records:
+                    self._cache_set(f"post_{record['id']}", record)
+            return formatted_records
+
+        except Exception as e:
+            logger.error("Error fetching posts: %s", e)
+            return []
+
+    def get_post_summaries(self, status_filter: Optional[str] = None) -> List[Dict]:
+        """
+        Fetch lightweight post summaries (no content or image columns)
+
+        List views that only show title/status/schedule don't need the
+        post bodies, which dominate the payload on large tables.
+
+        Args:
+            status_filter: Optional status to filter by
+
+        Returns:
+            List of post records in Airtable format with summary fields only
+        """
+        cache_key = f"post_summaries_{status_filter}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            records = []
+            start = 0
+            while True:
+                query = (
                     self.client.table("posts")
-                    .select("*")
+                    .select(self._SUMMARY_COLUMNS)
                     .order("created_at", desc=True)
-                    .execute()
+                    .range(start, start + self._PAGE_SIZE - 1)
                 )
+                if status_filter:
+                    query = query.eq("status", status_filter)
+
+                page = query.execute().data or []
+                records.extend(page)
+
+                if len(page) < self._PAGE_SIZE:
+                    break
+                start += self._PAGE_SIZE
 
-            records = response.data or []
-            # Convert to Airtable format for compatibility
             formatted_records = self._to_airtable_format_batch(records)
 
-            # Cache the result
-            self._cache[cache_key] = (formatted_records, time.time())
+            self._cache_set(cache_key, formatted_records)
             return formatted_records
 
         except Exception as e:
-            print(f"Error fetching posts: {e}")
+            logger.error("Error fetching post summaries: %s", e)
             return []
 
     def get_post(self, record_id: str) -> Optional[Dict]:
@@ -169,20 +375,33 @@ class SupabaseClient:
         Returns:
             Post record in Airtable format or None if not found
         """
+        # Per-record cache, seeded by get_all_posts: the common
+        # list-then-open flow never refetches the row
+        cached = self._cache_get(f"post_{record_id}")
+        if cached is not None:
+            return cached
+
         try:
             response = (
                 self.client.table("posts")
-                .select("*")
+                .select(self._ALL_COLUMNS)
                 .eq("id", record_id)
                 .single()
                 .execute()
             )
-            return self._to_airtable_format(response.data) if response.data else None
+            if not response.data:
+                return None
+
+            record = self._to_airtable_format(response.data)
+            self._cache_set(f"post_{record_id}", record)
+            return record
         except Exception as e:
-            print(f"Error fetching post {record_id}: {e}")
+            logger.error("Error fetching post %s: %s", record_id, e)
             return None
 
-    def update_post(self, record_id: str, fields: Dict[str, Any]) -> Dict:
+    def update_post(
+        self, record_id: str, fields: Dict[str, Any], returning: str = "representation"
+    ) -> Dict:
         """
         Update post fields
 
@@ -190,9 +409,11 @@ class SupabaseClient:
             record_id: Post ID
             fields: Dictionary of field names and values to update
                    Can be Airtable format (Title, Post Content) or Supabase format (title, post_content)
+            returning: "representation" to get the updated row back,
+                   "minimal" to skip the response payload entirely
 
         Returns:
-            Updated record data
+            Updated record data ({} when returning="minimal")
         """
         try:
             # Convert Airtable field names to Supabase format if needed
@@ -200,28 +421,29 @@ class SupabaseClient:
             for key, value in fields.items():
                 # Use reverse mapping to convert Airtable names to Supabase names
                 supabase_key = self.REVERSE_FIELD_MAP.get(key, key)
-                # Debug: log the conversion
-                if key != supabase_key:
-                    print(f"🔄 Converting field: '{key}' → '{supabase_key}'")
                 supabase_fields[supabase_key] = value
 
             # Add updated_at timestamp
-            supabase_fields["updated_at"] = datetime.utcnow().isoformat()
-            print(f"📝 Updating post {record_id} with fields: {list(supabase_fields.keys())}")
+            supabase_fields["updated_at"] = _utcnow_iso()
+            logger.debug(
+                "Updating post %s with fields: %s",
+                record_id, list(supabase_fields.keys()),
+            )
 
             response = (
                 self.client.table("posts")
-                .update(supabase_fields)
+                .update(supabase_fields, returning=returning)
                 .eq("id", record_id)
                 .execute()
             )
 
-            # Invalidate cache
-            self._clear_cache()
+            # Patch cached entries in place (clears only on status
+            # changes, which move records between filtered lists)
+            self._patch_record(record_id, supabase_fields)
 
             return response.data[0] if response.data else {}
         except Exception as e:
-            print(f"Error updating post {record_id}: {e}")
+            logger.error("Error updating post %s: %s", record_id, e)
             raise
 
     def update_status(self, record_id: str, new_status: str) -> Dict:
@@ -233,9 +455,77 @@ class SupabaseClient:
             new_status: New status value
 
         Returns:
-            Updated record data
+            Updated record data (empty: status flips only need success)
+        """
+        # A status flip only needs success/failure, so skip the row echo
+        return self.update_post(record_id, {"status": new_status}, returning="minimal")
+
+    def update_status_bulk(self, record_ids: List[str], new_status: str) -> int:
+        """
+        Update the status of many posts in a single query
+
+        Replaces per-record update round trips (N calls) with one
+        `.in_()` filtered update.
+
+        Args:
+            record_ids: List of post IDs to update
+            new_status: New status value for all of them
+
+        Returns:
+            Number of records updated
+        """
+        if not record_ids:
+            return 0
+
+        try:
+            supabase_fields = {
+                "status": new_status,
+                "updated_at": _utcnow_iso(),
+            }
+            # count header instead of echoed rows: the caller only needs
+            # how many records changed, not their contents
+            response = (
+                self.client.table("posts")
+                .update(supabase_fields, count="exact", returning="minimal")
+                .in_("id", record_ids)
+                .execute()
+            )
+
+            # Invalidate cache
+            self._clear_cache()
+
+            return response.count or 0
+        except Exception as e:
+            logger.error("Error bulk-updating %d posts: %s", len(record_ids), e)
+            raise
+
+    def delete_posts_bulk(self, record_ids: List[str]) -> bool:
         """
-        return self.update_post(record_id, {"status": new_status})
+        Delete many posts in a single query
+
+        Args:
+            record_ids: List of post IDs to delete
+
+        Returns:
+            True if successful
+        """
+        if not record_ids:
+            return True
+
+        try:
+            self.client.table("posts").delete(returning="minimal").in_(
+                "id", record_ids
+            ).execute()
+
+            # Patch the deleted rows out of cached lists instead of
+            # clearing everything
+            for record_id in record_ids:
+                self._invalidate_record(record_id)
+
+            return True
+        except Exception as e:
+            logger.error("Error bulk-deleting %d posts: %s", len(record_ids), e)
+            return False
 
     def request_revision(
         self, record_id: str, prompt: str, revision_type: str = "Both"
@@ -273,7 +563,7 @@ class SupabaseClient:
         try:
             response = (
                 self.client.table("posts")
-                .select("*")
+                .select(self._ALL_COLUMNS)
                 .eq("status", "Scheduled")
                 .gte("scheduled_time", start_date.isoformat())
                 .lte("scheduled_time", end_date.isoformat())
@@ -282,9 +572,238 @@ class SupabaseClient:
 
             return self._to_airtable_format_batch(response.data or [])
         except Exception as e:
-            print(f"Error fetching scheduled posts: {e}")
+            logger.error("Error fetching scheduled posts: %s", e)
             return []
 
+    def _fetch_busy_times(self, now: datetime) -> List[datetime]:
+        """
+        Fetch sorted scheduled times within the 30-day search horizon
+
+        Conflict detection only needs scheduled_time values inside the
+        horizon: a projected, bounded query moves tens of bytes per
+        relevant row instead of every column of every post, and skips
+        the Airtable-format mapping entirely.
+
+        Args:
+            now: Start of the horizon (naive UTC)
+
+        Returns:
+            Sorted list of naive-UTC datetimes
+        """
+        horizon = now + timedelta(days=30)
+        # Ordered and bounded server-side: the partial scheduled_time
+        # index hands rows back already sorted, so no client-side sort,
+        # and the limit caps the payload even on a pathological calendar
+        response = (
+            self.client.table("posts")
+            .select("scheduled_time")
+            .not_.is_("scheduled_time", "null")
+            .gte("scheduled_time", now.isoformat())
+            .lte("scheduled_time", horizon.isoformat())
+            .order("scheduled_time", desc=False)
+            .limit(500)
+            .execute()
+        )
+
+        scheduled_times = []
+        for row in response.data or []:
+            try:
+                busy = _parse_iso(row["scheduled_time"])
+                if busy.tzinfo is not None:
+                    busy = busy.astimezone(timezone.utc).replace(tzinfo=None)
+                scheduled_times.append(busy)
+            except (KeyError, ValueError, TypeError):
+                continue
+        return scheduled_times
+
+    def _find_slot(
+        self, scheduled_times: List[datetime], now: datetime
+    ) -> Optional[datetime]:
+        """
+        Find the next free posting slot after now
+
+        Args:
+            scheduled_times: Sorted busy times (naive UTC)
+            now: Search start (naive UTC)
+
+        Returns:
+            Chosen slot datetime, or None if every window is blocked
+        """
+        clearance = timedelta(minutes=30)
+
+        # Hoisted out of the loop: days become a single timedelta
+        # add onto midnight and windows a precomputed hour offset,
+        # instead of replace() arithmetic per candidate
+        day_base = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        window_offsets = tuple(timedelta(hours=h) for h in TIME_WINDOWS)
+        last_window_end = window_offsets[-1] + timedelta(minutes=59)
+        window_length = timedelta(minutes=59)
+
+        for days_ahead in range(31):
+            day = day_base + timedelta(days=days_ahead)
+
+            # One comparison skips a day whose windows are all in
+            # the past (only day 0 can be)
+            if day + last_window_end <= now:
+                continue
+
+            for offset in window_offsets:
+                # Sweep the whole window instead of sampling one
+                # random minute and rejecting: walk the (sorted)
+                # busy times that constrain this window and take the
+                # first gap, so a free minute is always found when
+                # one exists, with no retry loop
+                window_start = day + offset
+                window_end = window_start + window_length
+                if window_end <= now:
+                    continue
+
+                # Earliest allowed minute in this window
+                cursor = max(window_start, now + timedelta(minutes=1))
+                if cursor.second or cursor.microsecond:
+                    cursor = cursor.replace(
+                        second=0, microsecond=0
+                    ) + timedelta(minutes=1)
+
+                # Only busy entries within clearance of the window
+                # can block it; bisect slices them out of the sorted
+                # list
+                lo = bisect.bisect_left(
+                    scheduled_times, window_start - clearance
+                )
+                hi = bisect.bisect_right(
+                    scheduled_times, window_end + clearance
+                )
+
+                gap_end = None
+                for busy in scheduled_times[lo:hi]:
+                    if busy - clearance > cursor:
+                        gap_end = min(busy - clearance, window_end)
+                        break
+                    cursor = max(cursor, busy + clearance)
+                    if cursor.second or cursor.microsecond:
+                        cursor = cursor.replace(
+                            second=0, microsecond=0
+                        ) + timedelta(minutes=1)
+                    if cursor > window_end:
+                        break
+                else:
+                    if cursor <= window_end:
+                        gap_end = window_end
+
+                if gap_end is None:
+                    continue
+
+                # Randomize within the free gap so posting minutes
+                # don't cluster at window starts
+                span = int((gap_end - cursor).total_seconds() // 60)
+                return cursor + timedelta(minutes=random.randint(0, span))
+
+        return None
+
+    def schedule_post(self, record_id: str) -> Optional[str]:
+        """
+        Schedule a post into the next available posting slot
+
+        Looks for a free slot in the posting windows (TIME_WINDOWS hours
+        UTC) over the next 30 days, keeping at least 30 minutes of
+        clearance from every already-scheduled post, then writes the
+        status and scheduled_time.
+
+        Args:
+            record_id: Post ID to schedule
+
+        Returns:
+            ISO timestamp of the chosen slot, or None if no slot found
+        """
+        # Preferred path: the schedule_post database function picks and
+        # writes the slot in one transaction under a scheduler-wide
+        # advisory lock — a single round-trip, and concurrent schedulers
+        # cannot collide
+        try:
+            response = self.client.rpc(
+                "schedule_post", {"p_record_id": record_id}
+            ).execute()
+            if response.data:
+                self._clear_cache()
+                return response.data
+        except Exception:
+            # Function not deployed yet; use the client-side search
+            pass
+
+        try:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            candidate = self._find_slot(self._fetch_busy_times(now), now)
+            if candidate is None:
+                logger.error("Error scheduling post %s: no free slot in 30 days", record_id)
+                return None
+
+            slot_iso = candidate.isoformat()
+            self.update_post(
+                record_id,
+                {"status": "Scheduled", "scheduled_time": slot_iso},
+                returning="minimal",
+            )
+            return slot_iso
+        except Exception as e:
+            logger.error("Error scheduling post %s: %s", record_id, e)
+            return None
+
+    def schedule_posts_bulk(self, record_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Schedule many posts with one busy-times fetch and one write
+
+        Calling schedule_post in a loop would re-fetch the busy times
+        and issue a separate update per post; this fetches them once,
+        assigns all slots in memory (each assignment becoming a busy
+        time for the next), and writes everything in a single upsert.
+
+        Args:
+            record_ids: Post IDs to schedule
+
+        Returns:
+            Mapping of record_id to its ISO slot (None if no slot found)
+        """
+        if not record_ids:
+            return {}
+
+        try:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            busy = self._fetch_busy_times(now)
+
+            assigned: Dict[str, Optional[str]] = {}
+            updates = []
+            updated_at = _utcnow_iso()
+            for record_id in record_ids:
+                candidate = self._find_slot(busy, now)
+                if candidate is None:
+                    assigned[record_id] = None
+                    continue
+
+                # The new slot is busy for every later assignment
+                bisect.insort(busy, candidate)
+                slot_iso = candidate.isoformat()
+                assigned[record_id] = slot_iso
+                updates.append({
+                    "id": record_id,
+                    "status": "Scheduled",
+                    "scheduled_time": slot_iso,
+                    "updated_at": updated_at,
+                })
+
+            if updates:
+                self.client.table("posts").upsert(
+                    updates, returning="minimal"
+                ).execute()
+
+                # Invalidate cache
+                self._clear_cache()
+
+            return assigned
+        except Exception as e:
+            logger.error("Error bulk-scheduling %d posts: %s", len(record_ids), e)
+            return {record_id: None for record_id in record_ids}
+
     def create_post(self, fields: Dict[str, Any]) -> Dict:
         """
         Create a new post record
@@ -305,7 +824,7 @@ class SupabaseClient:
                 supabase_fields[supabase_key] = value
 
             # Add timestamps
-            now = datetime.utcnow().isoformat()
+            now = _utcnow_iso()
             supabase_fields["created_at"] = now
             supabase_fields["updated_at"] = now
 
@@ -316,7 +835,7 @@ class SupabaseClient:
 
             return response.data[0] if response.data else {}
         except Exception as e:
-            print(f"Error creating post: {e}")
+            logger.error("Error creating post: %s", e)
             raise
 
     def delete_post(self, record_id: str) -> bool:
@@ -330,19 +849,22 @@ class SupabaseClient:
             True if successful
         """
         try:
-            self.client.table("posts").delete().eq("id", record_id).execute()
+            self.client.table("posts").delete(returning="minimal").eq(
+                "id", record_id
+            ).execute()
 
-            # Invalidate cache
-            self._clear_cache()
+            # Patch the deleted row out of cached lists instead of
+            # clearing everything
+            self._invalidate_record(record_id)
 
             return True
         except Exception as e:
-            print(f"Error deleting post {record_id}: {e}")
+            logger.error("Error deleting post %s: %s", record_id, e)
             return False
 
     def get_posts_by_status(self, statuses: List[str]) -> List[Dict]:
         """
-        Get all posts with any of the specified statuses
+        Get all posts with any of the specified statuses (15-second cache)
 
         Args:
             statuses: List of status values to include
@@ -350,35 +872,136 @@ class SupabaseClient:
         Returns:
             List of matching posts in Airtable format
         """
+        if not statuses:
+            return []
+
+        # Cache key with sorted status list for consistency
+        cache_key = f"posts_status_{'_'.join(sorted(statuses))}"
+        cached = self._cache_get(cache_key, ttl=15)
+        if cached is not None:
+            return cached
+
         try:
-            all_posts = self.get_all_posts()
-            matching = [
-                post for post in all_posts
-                if post.get("fields", {}).get("Status") in statuses
-            ]
+            # Server-side .in_() filter: only matching rows travel over
+            # the wire and get converted, instead of the whole table
+            response = (
+                self.client.table("posts")
+                .select(self._ALL_COLUMNS)
+                .in_("status", statuses)
+                .order("created_at", desc=True)
+                .execute()
+            )
+            matching = self._to_airtable_format_batch(response.data or [])
+
+            self._cache_set(cache_key, matching)
             return matching
         except Exception as e:
-            print(f"Error fetching posts by status: {e}")
+            logger.error("Error fetching posts by status: %s", e)
             return []
 
-    def get_posts_count(self) -> int:
+    def get_posts_count(self, count_mode: str = "estimated") -> int:
         """
-        Get total count of posts in database
+        Get total count of posts in database (60-second cache)
+
+        Args:
+            count_mode: "estimated" reads the planner's row statistics
+                in O(1), which is plenty for a dashboard number;
+                pass "exact" for a true count(*) in diagnostic paths
 
         Returns:
             Number of posts
         """
+        cache_key = f"posts_count_{count_mode}"
+        cached = self._cache_get(cache_key, ttl=60)
+        if cached is not None:
+            return cached
+
         try:
+            # head=True asks PostgREST for the count header only, so no
+            # id rows travel over the wire at all
             response = (
                 self.client.table("posts")
-                .select("id", count="exact")
+                .select("id", count=count_mode, head=True)
                 .execute()
             )
-            return response.count or 0
+            count = response.count or 0
+            self._cache_set(cache_key, count)
+            return count
         except Exception as e:
-            print(f"Error getting posts count: {e}")
+            logger.error("Error getting posts count: %s", e)
             return 0
 
+    def upload_image_to_storage(
+        self,
+        image_bytes: bytes,
+        filename: Optional[str] = None,
+        bucket: str = "generated-images",
+    ) -> Optional[str]:
+        """
+        Upload image bytes to Supabase Storage and return the public URL
+
+        The content type is sniffed from the magic bytes so PNG/WebP
+        output isn't mislabeled as JPEG, and the object is uploaded with
+        an immutable cache-control header so browsers and the CDN can
+        cache the URL forever.
+
+        When filename is omitted it is derived from a hash of the bytes,
+        and an existing object under that name short-circuits the upload
+        entirely — regenerate/retry flows with identical output cost one
+        listing call instead of a re-upload.
+
+        Args:
+            image_bytes: Raw image data
+            filename: Object name within the bucket (defaults to a
+                content-hash name with deduplication)
+            bucket: Storage bucket name
+
+        Returns:
+            Public URL of the uploaded object, or None on failure
+        """
+        try:
+            if image_bytes.startswith(b"\x89PNG"):
+                content_type = "image/png"
+            elif image_bytes.startswith(b"\xff\xd8"):
+                content_type = "image/jpeg"
+            elif image_bytes.startswith((b"GIF87a", b"GIF89a")):
+                content_type = "image/gif"
+            elif image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+                content_type = "image/webp"
+            else:
+                content_type = "application/octet-stream"
+
+            if filename is None:
+                # Content-addressed name: identical bytes always map to
+                # the same object, so duplicates are detectable by name
+                digest = hashlib.sha256(image_bytes).hexdigest()[:32]
+                ext = {
+                    "image/png": "png",
+                    "image/jpeg": "jpg",
+                    "image/gif": "gif",
+                    "image/webp": "webp",
+                }.get(content_type, "bin")
+                filename = f"{digest}.{ext}"
+
+                existing = self.client.storage.from_(bucket).list(
+                    "", {"search": filename}
+                )
+                if existing:
+                    return self.client.storage.from_(bucket).get_public_url(filename)
+
+            self.client.storage.from_(bucket).upload(
+                filename,
+                image_bytes,
+                file_options={
+                    "content-type": content_type,
+                    "cache-control": "public, max-age=31536000, immutable",
+                },
+            )
+            return self.client.storage.from_(bucket).get_public_url(filename)
+        except Exception as e:
+            logger.error("Error uploading image %s: %s", filename, e)
+            return None
+
     def search_posts(self, query: str) -> List[Dict]:
         """
         Search posts by title or content
@@ -390,17 +1013,48 @@ class SupabaseClient:
             List of matching posts in Airtable format
         """
         try:
-            # Note: This is a basic search. For better full-text search,
-            # you might want to use Supabase's native full-text search
-            all_posts = self.get_all_posts()
-            query_lower = query.lower()
-
-            matching = [
-                post for post in all_posts
-                if query_lower in post.get("fields", {}).get("Title", "").lower()
-                or query_lower in post.get("fields", {}).get("Post Content", "").lower()
-            ]
-            return matching
+            # Strip the characters that delimit the PostgREST or_
+            # grammar and escape the ilike wildcards, so user input
+            # cannot reshape the filter expression
+            q = query.strip().translate(str.maketrans({",": " ", "(": " ", ")": " "}))
+            q = q.replace("%", r"\%").replace("_", r"\_").strip()
+            if not q:
+                return []
+
+            # Server-side case-insensitive match on either column: only
+            # matching rows come back, instead of pulling the whole
+            # table and substring-scanning it in Python
+            response = (
+                self.client.table("posts")
+                .select(self._ALL_COLUMNS)
+                .or_(f"title.ilike.%{q}%,post_content.ilike.%{q}%")
+                .order("created_at", desc=True)
+                .execute()
+            )
+            return self._to_airtable_format_batch(response.data or [])
         except Exception as e:
-            print(f"Error searching posts: {e}")
+            logger.error("Error searching posts: %s", e)
             return []
+
+
+_supabase_client: Optional["SupabaseClient"] = None
+
+
+def get_supabase_client() -> "SupabaseClient":
+    """
+    Return a shared SupabaseClient instance
+
+    create_client builds a fresh httpx connection pool every time, so
+    constructing a client per call pays a new TLS handshake on the first
+    query. A module-level instance keeps one pool (and its keep-alive
+    sockets) for the process lifetime. The Streamlit app gets the same
+    effect through its @st.cache_resource init_clients factory; this is
+    for scripts and workers that don't run under Streamlit.
+
+    Returns:
+        The shared SupabaseClient
+    """
+    global _supabase_client
+    if _supabase_client is None:
+        _supabase_client = SupabaseClient()
+    return _supabase_client